@@ -78,6 +78,19 @@ class Bot(commands.Bot):
         super().add_cog(cog)
         log.info(f"Cog loaded: {cog.qualified_name}")
 
+    def add_command(self, command: commands.Command) -> None:
+        """Add `command` to the bot and dispatch the `command_add` event."""
+        super().add_command(command)
+        self.dispatch("command_add", command)
+
+    def remove_command(self, name: str) -> Optional[commands.Command]:
+        """Remove the command called `name` from the bot and dispatch the `command_remove` event."""
+        command = super().remove_command(name)
+        if command is not None:
+            self.dispatch("command_remove", command)
+
+        return command
+
     def clear(self) -> None:
         """
         Clears the internal state of the bot and recreates the connector and sessions.
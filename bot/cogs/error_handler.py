@@ -2,7 +2,7 @@ import contextlib
 import logging
 import typing as t
 
-from discord.ext.commands import Cog, Context, errors
+from discord.ext.commands import Cog, Command, Context, errors
 from sentry_sdk import push_scope
 
 from bot.api import ResponseCodeError
@@ -13,6 +13,19 @@ from bot.utils.checks import InWhitelistCheckFailure
 
 log = logging.getLogger(__name__)
 
+ErrorHandlerFunc = t.Callable[[Context, errors.CommandError], t.Awaitable[None]]
+
+# API status code -> (message sent in the invoking context, log level, stat to increment)
+API_ERROR_RESPONSES: t.Dict[int, t.Tuple[str, int, str]] = {
+    400: ("According to the API, your request is malformed.", logging.DEBUG, "errors.api_error_400"),
+    404: ("There does not seem to be anything matching your query.", logging.DEBUG, "errors.api_error_404"),
+    **dict.fromkeys(range(500, 600), (
+        "Sorry, there seems to be an internal issue with the API.",
+        logging.WARNING,
+        "errors.api_internal_server_error",
+    )),
+}
+
 
 class ErrorHandler(Cog):
     """Handles errors emitted from commands."""
@@ -20,13 +33,26 @@ class ErrorHandler(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+        # Looked up through the MRO of the error, so subclasses fall back to their base's handler.
+        self._error_handlers: t.Dict[t.Type[errors.CommandError], ErrorHandlerFunc] = {
+            errors.UserInputError: self.handle_user_input_error,
+            errors.CheckFailure: self.handle_check_failure,
+            errors.CommandOnCooldown: self.handle_cooldown,
+            errors.DisabledCommand: self.handle_disabled_command,
+        }
+        # Handlers already resolved for a concrete error type, so each type only walks its MRO once.
+        self._resolved_error_handlers: t.Dict[t.Type[errors.CommandError], t.Optional[ErrorHandlerFunc]] = {}
+
+        # Commands invoked as fallbacks for CommandNotFound, keyed by qualified name.
+        self._fallback_commands: t.Dict[str, t.Optional[Command]] = {}
+
     @Cog.listener()
     async def on_command_error(self, ctx: Context, e: errors.CommandError) -> None:
         """
         Provide generic command error handling.
 
         Error handling is deferred to any local error handler, if present. This is done by
-        checking for the presence of a `handled` attribute on the error.
+        checking for a truthy `handled` attribute on the error.
 
         Error handling emits a single error message in the invoking context `ctx` and a log message,
         prioritised as follows:
@@ -44,41 +70,87 @@ class ErrorHandler(Cog):
         5. ResponseCodeError: see `handle_api_error`
         6. Otherwise, if not a DisabledCommand, handling is deferred to `handle_unexpected_error`
         """
-        command = ctx.command
-
-        if hasattr(e, "handled"):
-            log.trace(f"Command {command} had its error already handled locally; ignoring.")
+        if getattr(e, "handled", False):
+            log.trace("Command %s had its error already handled locally; ignoring.", ctx.command)
             return
 
         if isinstance(e, errors.CommandNotFound) and not hasattr(ctx, "invoked_from_error_handler"):
-            if await self.try_silence(ctx):
-                return
-            if ctx.channel.id != Channels.verification:
-                # Try to look for a tag with the command's name
-                await self.try_get_tag(ctx)
-                return  # Exit early to avoid logging.
-        elif isinstance(e, errors.UserInputError):
-            await self.handle_user_input_error(ctx, e)
-        elif isinstance(e, errors.CheckFailure):
-            await self.handle_check_failure(ctx, e)
-        elif isinstance(e, errors.CommandOnCooldown):
-            await ctx.send(e)
-        elif isinstance(e, errors.CommandInvokeError):
+            await self.handle_command_not_found(ctx, e)
+        else:
+            await self.handle_command_error(ctx, e)
+
+    async def handle_command_not_found(self, ctx: Context, e: errors.CommandNotFound) -> None:
+        """Fall back to silencing the channel or to showing a tag, unless in the verification channel."""
+        if await self.try_silence(ctx):
+            return
+        if ctx.channel.id != Channels.verification:
+            # Try to look for a tag with the command's name
+            await self.try_get_tag(ctx)
+            return  # Exit early to avoid logging.
+
+        log.debug(
+            "Command %s invoked by %s with error %s: %s",
+            ctx.command, ctx.message.author, e.__class__.__name__, e
+        )
+
+    async def handle_command_error(self, ctx: Context, e: errors.CommandError) -> None:
+        """
+        Handle `e` without attempting any of the CommandNotFound fallbacks.
+
+        This is used directly for errors raised by the fallbacks themselves, so they don't re-enter
+        `on_command_error`. A CommandNotFound is treated as unexpected here.
+        """
+        if isinstance(e, errors.CommandInvokeError):
             if isinstance(e.original, ResponseCodeError):
                 await self.handle_api_error(ctx, e.original)
             else:
                 await self.handle_unexpected_error(ctx, e.original)
             return  # Exit early to avoid logging.
-        elif not isinstance(e, errors.DisabledCommand):
+
+        handler = self.get_error_handler(e)
+        if handler is None:
             # ConversionError, MaxConcurrencyReached, ExtensionError
             await self.handle_unexpected_error(ctx, e)
             return  # Exit early to avoid logging.
 
+        await handler(ctx, e)
         log.debug(
-            f"Command {command} invoked by {ctx.message.author} with error "
-            f"{e.__class__.__name__}: {e}"
+            "Command %s invoked by %s with error %s: %s",
+            ctx.command, ctx.message.author, e.__class__.__name__, e
         )
 
+    @Cog.listener()
+    async def on_command_add(self, _: Command) -> None:
+        """Clear the cached fallback commands when a command is added."""
+        self._fallback_commands.clear()
+
+    @Cog.listener()
+    async def on_command_remove(self, _: Command) -> None:
+        """Clear the cached fallback commands when a command is removed."""
+        self._fallback_commands.clear()
+
+    def get_fallback_command(self, name: str) -> t.Optional[Command]:
+        """Return the command with the qualified `name`, caching the lookup until the commands change."""
+        if name not in self._fallback_commands:
+            self._fallback_commands[name] = self.bot.get_command(name)
+
+        return self._fallback_commands[name]
+
+    def get_error_handler(self, e: errors.CommandError) -> t.Optional[ErrorHandlerFunc]:
+        """Return the handler registered for the nearest class in the MRO of `e`, or None if there is none."""
+        error_type = type(e)
+        if error_type in self._resolved_error_handlers:
+            return self._resolved_error_handlers[error_type]
+
+        handler = None
+        for cls in error_type.__mro__:
+            handler = self._error_handlers.get(cls)
+            if handler is not None:
+                break
+
+        self._resolved_error_handlers[error_type] = handler
+        return handler
+
     @staticmethod
     def get_help_command(ctx: Context) -> t.Coroutine:
         """Return a prepared `help` command invocation coroutine."""
@@ -97,7 +169,11 @@ class ErrorHandler(Cog):
         Return bool depending on success of command.
         """
         command = ctx.invoked_with.lower()
-        silence_command = self.bot.get_command("silence")
+        silence_command = self.get_fallback_command("silence")
+        if silence_command is None:
+            # The Silence cog isn't loaded.
+            return False
+
         ctx.invoked_from_error_handler = True
         try:
             if not await silence_command.can_run(ctx):
@@ -110,7 +186,7 @@ class ErrorHandler(Cog):
             await ctx.invoke(silence_command, duration=min(command.count("h")*2, 15))
             return True
         elif command.startswith("unshh"):
-            await ctx.invoke(self.bot.get_command("unsilence"))
+            await ctx.invoke(self.get_fallback_command("unsilence"))
             return True
         return False
 
@@ -118,11 +194,21 @@ class ErrorHandler(Cog):
         """
         Attempt to display a tag by interpreting the command name as a tag name.
 
-        The invocation of tags get respects its checks. Any CommandErrors raised will be handled
-        by `on_command_error`, but the `invoked_from_error_handler` attribute will be added to
-        the context to prevent infinite recursion in the case of a CommandNotFound exception.
+        The invocation of tags get respects its checks. Any CommandErrors raised by the checks are
+        handled by `handle_command_error`, which never falls back to a tag again. The
+        `invoked_from_error_handler` attribute is also added to the context to prevent infinite
+        recursion if the tag invocation itself raises a CommandNotFound exception.
         """
-        tags_get_command = self.bot.get_command("tags get")
+        tags_get_command = self.get_fallback_command("tags get")
+        if tags_get_command is None:
+            # The Tags cog isn't loaded.
+            return
+
+        permissions = ctx.channel.permissions_for(ctx.me)
+        if not permissions.send_messages or not permissions.embed_links:
+            log.debug("Cancelling attempt to fall back to a tag; the bot can't send embeds in the channel.")
+            return
+
         ctx.invoked_from_error_handler = True
 
         log_msg = "Cancelling attempt to fall back to a tag due to failed checks."
@@ -132,15 +218,15 @@ class ErrorHandler(Cog):
                 return
         except errors.CommandError as tag_error:
             log.debug(log_msg)
-            await self.on_command_error(ctx, tag_error)
+            await self.handle_command_error(ctx, tag_error)
             return
 
         try:
             tag_name = await TagNameConverter.convert(ctx, ctx.invoked_with)
         except errors.BadArgument:
             log.debug(
-                f"{ctx.author} tried to use an invalid command "
-                f"and the fallback tag failed validation in TagNameConverter."
+                "%s tried to use an invalid command and the fallback tag failed validation in TagNameConverter.",
+                ctx.author
             )
         else:
             with contextlib.suppress(ResponseCodeError):
@@ -159,19 +245,17 @@ class ErrorHandler(Cog):
         * ArgumentParsingError: send an error message
         * Other: send an error message and the help command
         """
-        prepared_help_command = self.get_help_command(ctx)
-
         if isinstance(e, errors.MissingRequiredArgument):
             await ctx.send(f"Missing required argument `{e.param.name}`.")
-            await prepared_help_command
+            await self.get_help_command(ctx)
             self.bot.stats.incr("errors.missing_required_argument")
         elif isinstance(e, errors.TooManyArguments):
             await ctx.send("Too many arguments provided.")
-            await prepared_help_command
+            await self.get_help_command(ctx)
             self.bot.stats.incr("errors.too_many_arguments")
         elif isinstance(e, errors.BadArgument):
             await ctx.send(f"Bad argument: {e}\n")
-            await prepared_help_command
+            await self.get_help_command(ctx)
             self.bot.stats.incr("errors.bad_argument")
         elif isinstance(e, errors.BadUnionArgument):
             await ctx.send(f"Bad argument: {e}\n```{e.errors[-1]}```")
@@ -181,7 +265,7 @@ class ErrorHandler(Cog):
             self.bot.stats.incr("errors.argument_parsing_error")
         else:
             await ctx.send("Something about your input seems off. Check the arguments:")
-            await prepared_help_command
+            await self.get_help_command(ctx)
             self.bot.stats.incr("errors.other_user_input_error")
 
     @staticmethod
@@ -212,26 +296,34 @@ class ErrorHandler(Cog):
             ctx.bot.stats.incr("errors.wrong_channel_or_dm_error")
             await ctx.send(e)
 
+    @staticmethod
+    async def handle_cooldown(ctx: Context, e: errors.CommandOnCooldown) -> None:
+        """Send the cooldown error message in `ctx`."""
+        await ctx.send(e)
+
+    @staticmethod
+    async def handle_disabled_command(ctx: Context, e: errors.DisabledCommand) -> None:
+        """Ignore DisabledCommand; it's only logged by `handle_command_error`."""
+
     @staticmethod
     async def handle_api_error(ctx: Context, e: ResponseCodeError) -> None:
         """Send an error message in `ctx` for ResponseCodeError and log it."""
-        if e.status == 404:
-            await ctx.send("There does not seem to be anything matching your query.")
-            log.debug(f"API responded with 404 for command {ctx.command}")
-            ctx.bot.stats.incr("errors.api_error_404")
-        elif e.status == 400:
-            content = await e.response.json()
-            log.debug(f"API responded with 400 for command {ctx.command}: %r.", content)
-            await ctx.send("According to the API, your request is malformed.")
-            ctx.bot.stats.incr("errors.api_error_400")
-        elif 500 <= e.status < 600:
-            await ctx.send("Sorry, there seems to be an internal issue with the API.")
-            log.warning(f"API responded with {e.status} for command {ctx.command}")
-            ctx.bot.stats.incr("errors.api_internal_server_error")
-        else:
+        response = API_ERROR_RESPONSES.get(e.status)
+        if response is None:
             await ctx.send(f"Got an unexpected status code from the API (`{e.status}`).")
-            log.warning(f"Unexpected API response for command {ctx.command}: {e.status}")
+            log.warning("Unexpected API response for command %s: %s", ctx.command, e.status)
             ctx.bot.stats.incr(f"errors.api_error_{e.status}")
+            return
+
+        message, log_level, stat = response
+        if e.status == 400:
+            content = await e.response.json()
+            log.log(log_level, "API responded with 400 for command %s: %r.", ctx.command, content)
+        else:
+            log.log(log_level, "API responded with %s for command %s", e.status, ctx.command)
+
+        await ctx.send(message)
+        ctx.bot.stats.incr(stat)
 
     @staticmethod
     async def handle_unexpected_error(ctx: Context, e: errors.CommandError) -> None:
@@ -243,25 +335,29 @@ class ErrorHandler(Cog):
 
         ctx.bot.stats.incr("errors.unexpected")
 
+        message = ctx.message
+        author = message.author
+        channel_id = ctx.channel.id
+
         with push_scope() as scope:
             scope.user = {
-                "id": ctx.author.id,
-                "username": str(ctx.author)
+                "id": author.id,
+                "username": str(author)
             }
 
             scope.set_tag("command", ctx.command.qualified_name)
-            scope.set_tag("message_id", ctx.message.id)
-            scope.set_tag("channel_id", ctx.channel.id)
+            scope.set_tag("message_id", message.id)
+            scope.set_tag("channel_id", channel_id)
 
-            scope.set_extra("full_message", ctx.message.content)
+            scope.set_extra("full_message", message.content)
 
             if ctx.guild is not None:
                 scope.set_extra(
                     "jump_to",
-                    f"https://discordapp.com/channels/{ctx.guild.id}/{ctx.channel.id}/{ctx.message.id}"
+                    f"https://discordapp.com/channels/{ctx.guild.id}/{channel_id}/{message.id}"
                 )
 
-            log.error(f"Error executing command invoked by {ctx.message.author}: {ctx.message.content}", exc_info=e)
+            log.error("Error executing command invoked by %s: %s", author, message.content, exc_info=e)
 
 
 def setup(bot: Bot) -> None:
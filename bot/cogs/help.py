@@ -3,11 +3,11 @@ import logging
 from asyncio import TimeoutError
 from collections import namedtuple
 from contextlib import suppress
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from discord import Colour, Embed, Member, Message, NotFound, Reaction, User
 from discord.ext.commands import Bot, Cog, Command, Context, Group, HelpCommand
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process
 
 from bot import constants
 from bot.constants import Channels, Emojis, STAFF_ROLES
@@ -120,17 +120,10 @@ class CustomHelpCommand(HelpCommand):
         Options and choices are case sensitive.
         """
         # first get all commands including subcommands and full command name aliases
+        command_choices = self.cog.get_command_choices()
         choices = set()
-        for command in await self.filter_commands(self.context.bot.walk_commands()):
-            # the the command or group name
-            choices.add(str(command))
-
-            if isinstance(command, Command):
-                # all aliases if it's just a command
-                choices.update(command.aliases)
-            else:
-                # otherwise we need to add the parent name in
-                choices.update(f"{command.full_parent_name} {alias}" for alias in command.aliases)
+        for command in await self.filter_commands(command_choices):
+            choices.update(command_choices[command])
 
         # all cog names
         choices.update(self.context.bot.cogs)
@@ -146,9 +139,11 @@ class CustomHelpCommand(HelpCommand):
         Will return an instance of the `HelpQueryNotFound` exception with the error message and possible matches.
         """
         choices = await self.get_all_help_choices()
-        result = process.extractBests(string, choices, scorer=fuzz.ratio, score_cutoff=60)
+        result = process.extract(string, choices, scorer=fuzz.ratio, score_cutoff=60)
 
-        return HelpQueryNotFound(f'Query "{string}" not found.', dict(result))
+        # Newer RapidFuzz releases append the choice's index/key to each match.
+        possible_matches = {choice: score for choice, score, *_ in result}
+        return HelpQueryNotFound(f'Query "{string}" not found.', possible_matches)
 
     async def subcommand_not_found(self, command: Command, string: str) -> "HelpQueryNotFound":
         """
@@ -358,10 +353,47 @@ class Help(Cog):
         bot.help_command = CustomHelpCommand()
         bot.help_command.cog = self
 
+        self._command_choices: Optional[Dict[Command, Tuple[str, ...]]] = None
+
     def cog_unload(self) -> None:
         """Reset the help command when the cog is unloaded."""
         self.bot.help_command = self.old_help_command
 
+    def get_command_choices(self) -> Dict[Command, Tuple[str, ...]]:
+        """
+        Return a mapping of every command to the names it can be queried by.
+
+        The mapping is built from `walk_commands` on first use and cached until a command is
+        added to or removed from the bot.
+        """
+        if self._command_choices is None:
+            self._command_choices = {}
+
+            for command in self.bot.walk_commands():
+                # the the command or group name
+                names = [str(command)]
+
+                if isinstance(command, Command):
+                    # all aliases if it's just a command
+                    names.extend(command.aliases)
+                else:
+                    # otherwise we need to add the parent name in
+                    names.extend(f"{command.full_parent_name} {alias}" for alias in command.aliases)
+
+                self._command_choices[command] = tuple(names)
+
+        return self._command_choices
+
+    @Cog.listener()
+    async def on_command_add(self, _: Command) -> None:
+        """Invalidate the cached help choices when a command is added."""
+        self._command_choices = None
+
+    @Cog.listener()
+    async def on_command_remove(self, _: Command) -> None:
+        """Invalidate the cached help choices when a command is removed."""
+        self._command_choices = None
+
 
 def setup(bot: Bot) -> None:
     """Load the Help cog."""
@@ -0,0 +1,220 @@
+import inspect
+import logging
+import unittest
+from unittest import mock
+
+from discord.ext.commands import errors
+
+from bot.api import ResponseCodeError
+from bot.cogs.error_handler import ErrorHandler
+from tests.helpers import MockBot, MockContext
+
+
+class ErrorHandlerFallbackTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the cached commands used as CommandNotFound fallbacks."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = ErrorHandler(self.bot)
+        self.ctx = MockContext(bot=self.bot)
+
+    async def test_cached_miss_cleared_on_command_add(self):
+        """A cached miss for `tags get` should be looked up again after a command is added."""
+        tags_get_command = mock.MagicMock()
+        self.bot.get_command.return_value = None
+
+        self.assertIsNone(self.cog.get_fallback_command("tags get"))
+
+        self.bot.get_command.return_value = tags_get_command
+        self.assertIsNone(self.cog.get_fallback_command("tags get"))
+
+        await self.cog.on_command_add(tags_get_command)
+        self.assertIs(self.cog.get_fallback_command("tags get"), tags_get_command)
+        self.assertEqual(self.bot.get_command.call_count, 2)
+
+    async def test_try_silence_returns_early_without_command(self):
+        """`try_silence` should return False without invoking anything if silence isn't loaded."""
+        self.bot.get_command.return_value = None
+        self.ctx.invoked_with = "shhh"
+
+        self.assertFalse(await self.cog.try_silence(self.ctx))
+        self.ctx.invoke.assert_not_awaited()
+
+    async def test_try_get_tag_returns_early_without_command(self):
+        """`try_get_tag` should return without invoking anything if tags get isn't loaded."""
+        self.bot.get_command.return_value = None
+
+        self.assertIsNone(await self.cog.try_get_tag(self.ctx))
+        self.ctx.invoke.assert_not_awaited()
+        self.ctx.channel.permissions_for.assert_not_called()
+
+    async def test_try_get_tag_returns_early_without_embed_permissions(self):
+        """`try_get_tag` shouldn't run the tag checks if the bot can't send embeds in the channel."""
+        tags_get_command = mock.MagicMock()
+        tags_get_command.can_run = mock.AsyncMock(return_value=True)
+        self.bot.get_command.return_value = tags_get_command
+
+        test_cases = (
+            {"send_messages": False, "embed_links": True},
+            {"send_messages": True, "embed_links": False},
+        )
+
+        for permissions in test_cases:
+            with self.subTest(**permissions):
+                self.ctx.channel.permissions_for.return_value = mock.MagicMock(**permissions)
+
+                self.assertIsNone(await self.cog.try_get_tag(self.ctx))
+                tags_get_command.can_run.assert_not_awaited()
+                self.ctx.invoke.assert_not_awaited()
+
+    async def test_tag_check_error_handled_without_reentering_fallbacks(self):
+        """A CommandError from the tags get checks should go to `handle_command_error` only."""
+        tag_error = errors.CheckFailure()
+        tags_get_command = mock.MagicMock()
+        tags_get_command.can_run = mock.AsyncMock(side_effect=tag_error)
+        self.bot.get_command.return_value = tags_get_command
+
+        # A plain mock, since the fallbacks set `invoked_from_error_handler` on the context.
+        ctx = mock.MagicMock()
+        del ctx.invoked_from_error_handler
+        ctx.channel.permissions_for.return_value = mock.MagicMock(send_messages=True, embed_links=True)
+
+        handle_command_not_found = mock.AsyncMock(wraps=self.cog.handle_command_not_found)
+
+        with mock.patch.object(self.cog, "try_silence", return_value=False) as try_silence:
+            with mock.patch.object(self.cog, "handle_command_error") as handle_command_error:
+                with mock.patch.object(self.cog, "handle_command_not_found", handle_command_not_found):
+                    await self.cog.on_command_error(ctx, errors.CommandNotFound())
+
+        handle_command_error.assert_awaited_once_with(ctx, tag_error)
+        handle_command_not_found.assert_awaited_once()
+        try_silence.assert_awaited_once_with(ctx)
+        ctx.invoke.assert_not_called()
+
+
+class ErrorHandlerDispatchTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for routing errors to their handlers in `on_command_error`."""
+
+    def setUp(self):
+        # The handler table binds the methods when the cog is created, so patch them on the class first.
+        for name in ("handle_check_failure", "handle_user_input_error", "handle_unexpected_error"):
+            patcher = mock.patch.object(ErrorHandler, name, new_callable=mock.AsyncMock)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+        self.bot = MockBot()
+        self.cog = ErrorHandler(self.bot)
+        self.ctx = MockContext(bot=self.bot)
+
+    async def test_missing_role_routes_to_check_failure(self):
+        """MissingRole should be handled by `handle_check_failure`."""
+        error = errors.MissingRole("Helpers")
+
+        await self.cog.on_command_error(self.ctx, error)
+
+        self.handle_check_failure.assert_awaited_once_with(self.ctx, error)
+        self.handle_unexpected_error.assert_not_awaited()
+
+    async def test_missing_required_argument_routes_to_user_input_error(self):
+        """MissingRequiredArgument should be handled by `handle_user_input_error`."""
+        param = inspect.Parameter("arg", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        error = errors.MissingRequiredArgument(param)
+
+        await self.cog.on_command_error(self.ctx, error)
+
+        self.handle_user_input_error.assert_awaited_once_with(self.ctx, error)
+        self.handle_unexpected_error.assert_not_awaited()
+
+    async def test_disabled_command_is_only_logged(self):
+        """DisabledCommand shouldn't send a message, only log at debug level."""
+        with mock.patch("bot.cogs.error_handler.log") as log:
+            await self.cog.on_command_error(self.ctx, errors.DisabledCommand())
+
+        self.ctx.send.assert_not_awaited()
+        log.debug.assert_called_once()
+        self.handle_unexpected_error.assert_not_awaited()
+
+    async def test_conversion_error_routes_to_unexpected_error(self):
+        """ConversionError has no registered handler, so it should be treated as unexpected."""
+        error = errors.ConversionError(mock.MagicMock(), ValueError())
+
+        await self.cog.on_command_error(self.ctx, error)
+
+        self.handle_unexpected_error.assert_awaited_once_with(self.ctx, error)
+
+    async def test_command_not_found_from_error_handler_routes_to_unexpected_error(self):
+        """CommandNotFound raised from a fallback should be treated as unexpected."""
+        ctx = mock.MagicMock()
+        ctx.invoked_from_error_handler = True
+        error = errors.CommandNotFound()
+
+        with mock.patch.object(self.cog, "try_silence") as try_silence:
+            await self.cog.on_command_error(ctx, error)
+
+        try_silence.assert_not_called()
+        self.handle_unexpected_error.assert_awaited_once_with(ctx, error)
+
+    def test_get_error_handler_memoised(self):
+        """A second lookup for the same error type should return the memoised handler."""
+        first = self.cog.get_error_handler(errors.MissingRole("Helpers"))
+
+        self.cog._error_handlers = {}
+        second = self.cog.get_error_handler(errors.MissingRole("Admins"))
+
+        self.assertIs(first, self.handle_check_failure)
+        self.assertIs(second, first)
+
+
+class HandleAPIErrorTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for `handle_api_error`."""
+
+    def setUp(self):
+        self.ctx = MockContext()
+
+    @staticmethod
+    def make_error(status: int) -> ResponseCodeError:
+        """Return a ResponseCodeError for a mocked response with the given `status`."""
+        response = mock.MagicMock(status=status)
+        response.json = mock.AsyncMock(return_value={"detail": "malformed"})
+        return ResponseCodeError(response=response)
+
+    async def test_404(self):
+        """A 404 should send the not found message and log at debug level."""
+        with mock.patch("bot.cogs.error_handler.log") as log:
+            await ErrorHandler.handle_api_error(self.ctx, self.make_error(404))
+
+        self.ctx.send.assert_awaited_once_with("There does not seem to be anything matching your query.")
+        self.assertEqual(log.log.call_args[0][0], logging.DEBUG)
+        self.ctx.bot.stats.incr.assert_called_once_with("errors.api_error_404")
+
+    async def test_400_logs_response_json(self):
+        """A 400 should read the response JSON and include it in the debug log."""
+        error = self.make_error(400)
+
+        with mock.patch("bot.cogs.error_handler.log") as log:
+            await ErrorHandler.handle_api_error(self.ctx, error)
+
+        error.response.json.assert_awaited_once_with()
+        log.log.assert_called_once_with(
+            logging.DEBUG, "API responded with 400 for command %s: %r.", self.ctx.command, {"detail": "malformed"}
+        )
+        self.ctx.send.assert_awaited_once_with("According to the API, your request is malformed.")
+        self.ctx.bot.stats.incr.assert_called_once_with("errors.api_error_400")
+
+    async def test_503(self):
+        """A 5xx status should send the internal issue message and log a warning."""
+        with mock.patch("bot.cogs.error_handler.log") as log:
+            await ErrorHandler.handle_api_error(self.ctx, self.make_error(503))
+
+        self.ctx.send.assert_awaited_once_with("Sorry, there seems to be an internal issue with the API.")
+        self.assertEqual(log.log.call_args[0][0], logging.WARNING)
+        self.ctx.bot.stats.incr.assert_called_once_with("errors.api_internal_server_error")
+
+    async def test_unknown_status(self):
+        """A status without an entry should send the unexpected status message and log a warning."""
+        with mock.patch("bot.cogs.error_handler.log") as log:
+            await ErrorHandler.handle_api_error(self.ctx, self.make_error(418))
+
+        self.ctx.send.assert_awaited_once_with("Got an unexpected status code from the API (`418`).")
+        log.warning.assert_called_once()
+        self.ctx.bot.stats.incr.assert_called_once_with("errors.api_error_418")
@@ -0,0 +1,126 @@
+import unittest
+from unittest import mock
+
+from discord.ext import commands
+
+from bot.cogs.help import CustomHelpCommand, Help
+from tests.helpers import MockBot, MockContext
+
+
+class HelpCommandChoicesTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the cached command choices used by the help command's suggestions."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.bot.cogs = {}
+
+        # The help command's cog is normally wired up when it's added to a real bot.
+        cog_patcher = mock.patch.object(CustomHelpCommand, "cog", new_callable=mock.PropertyMock)
+        self.help_command_cog = cog_patcher.start()
+        self.addCleanup(cog_patcher.stop)
+
+        self.cog = Help(self.bot)
+        self.help_command_cog.return_value = self.cog
+
+        self.command = commands.Command(mock.AsyncMock(), name="foo", aliases=["f", "fo"])
+        self.group = commands.Group(mock.AsyncMock(), name="grp", aliases=["g"])
+        self.subcommand = self.group.command(name="sub", aliases=["s"])(mock.AsyncMock())
+
+        # `walk_commands` yields each command once, but `all_commands` has an entry per alias.
+        self.walk = [self.command, self.command, self.group, self.subcommand]
+        self.bot.walk_commands.side_effect = lambda: iter(self.walk)
+
+    @staticmethod
+    def old_walk(command_list: list) -> set:
+        """Replicate how `get_all_help_choices` collected command names before they were cached."""
+        choices = set()
+        for command in command_list:
+            choices.add(str(command))
+
+            if isinstance(command, commands.Command):
+                choices.update(command.aliases)
+            else:
+                choices.update(f"{command.full_parent_name} {alias}" for alias in command.aliases)
+
+        return choices
+
+    def test_get_command_choices_tuples(self):
+        """Each command should map to its name followed by its aliases, once per command."""
+        choices = self.cog.get_command_choices()
+
+        self.assertEqual(choices, {
+            self.command: ("foo", "f", "fo"),
+            self.group: ("grp", "g"),
+            self.subcommand: ("grp sub", "s"),
+        })
+
+    def test_get_command_choices_is_cached(self):
+        """The mapping should only be built once while the commands don't change."""
+        first = self.cog.get_command_choices()
+        second = self.cog.get_command_choices()
+
+        self.assertIs(first, second)
+        self.bot.walk_commands.assert_called_once_with()
+
+    async def test_command_events_reset_cache(self):
+        """The mapping should be rebuilt after a command is added or removed."""
+        for listener in (self.cog.on_command_add, self.cog.on_command_remove):
+            with self.subTest(listener=listener.__name__):
+                self.cog._command_choices = None
+                self.bot.walk_commands.reset_mock()
+                first = self.cog.get_command_choices()
+
+                await listener(self.command)
+                second = self.cog.get_command_choices()
+
+                self.assertIsNot(first, second)
+                self.assertEqual(first, second)
+                self.assertEqual(self.bot.walk_commands.call_count, 2)
+
+    async def test_get_all_help_choices_matches_old_walk(self):
+        """The help choices built from the cache should equal those of the uncached walk."""
+        help_command = self.bot.help_command
+        help_command.context = MockContext(bot=self.bot)
+
+        with mock.patch.object(
+            help_command, "filter_commands", side_effect=lambda cmds, **_: list(cmds)
+        ):
+            choices = await help_command.get_all_help_choices()
+
+        self.assertEqual(choices, self.old_walk(self.walk))
+
+
+class HelpCommandSuggestionTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the suggestions given when a help query isn't found."""
+
+    def setUp(self):
+        self.help_command = CustomHelpCommand()
+        self.choices = {
+            "tags", "tags get", "tags search", "help", "Moderation", "silence", "unsilence", "Information"
+        }
+
+    async def test_command_not_found_suggestions(self):
+        """Known queries should suggest the same choices, best match first."""
+        test_cases = (
+            ("tgas", ["tags"]),
+            ("hlep", ["help"]),
+            ("slience", ["silence", "unsilence"]),
+            ("modreation", ["Moderation", "Information"]),
+            ("tags gte", ["tags get", "tags", "tags search"]),
+            ("xyz", []),
+        )
+
+        for query, expected in test_cases:
+            with self.subTest(query=query):
+                with mock.patch.object(self.help_command, "get_all_help_choices", return_value=self.choices):
+                    error = await self.help_command.command_not_found(query)
+
+                self.assertEqual(list(error.possible_matches), expected)
+
+    async def test_command_not_found_accepts_matches_with_index(self):
+        """Matches with a trailing index, as returned by newer RapidFuzz releases, should be accepted."""
+        with mock.patch.object(self.help_command, "get_all_help_choices", return_value=self.choices), \
+                mock.patch("bot.cogs.help.process.extract", return_value=[("tags", 75.0, 1)]):
+            error = await self.help_command.command_not_found("tgas")
+
+        self.assertEqual(error.possible_matches, {"tags": 75.0})
@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+
+from discord.ext import commands
+
+from bot.bot import Bot
+from tests.helpers import _get_mock_loop
+
+
+class BotCommandEventTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `command_add` and `command_remove` events dispatched by `Bot`."""
+
+    def setUp(self):
+        self.bot = Bot(command_prefix="!", loop=_get_mock_loop())
+        self.command = commands.Command(mock.AsyncMock(), name="foo")
+
+    def test_add_command_dispatches_command_add(self):
+        """`add_command` should dispatch `command_add` with the added command."""
+        with mock.patch.object(self.bot, "dispatch") as dispatch:
+            self.bot.add_command(self.command)
+
+        self.assertIs(self.bot.get_command("foo"), self.command)
+        dispatch.assert_called_once_with("command_add", self.command)
+
+    def test_remove_command_dispatches_command_remove(self):
+        """`remove_command` should dispatch `command_remove` with the removed command."""
+        self.bot.add_command(self.command)
+
+        with mock.patch.object(self.bot, "dispatch") as dispatch:
+            removed = self.bot.remove_command("foo")
+
+        self.assertIs(removed, self.command)
+        dispatch.assert_called_once_with("command_remove", self.command)
+
+    def test_remove_command_does_not_dispatch_for_missing_name(self):
+        """`remove_command` shouldn't dispatch `command_remove` if no command was removed."""
+        with mock.patch.object(self.bot, "dispatch") as dispatch:
+            removed = self.bot.remove_command("foo")
+
+        self.assertIsNone(removed)
+        dispatch.assert_not_called()